@@ -9,15 +9,68 @@ dag_path = os.path.abspath(os.path.dirname(__file__))
 src_path = os.path.join(dag_path, '..', '..', 'src')
 sys.path.append(os.path.abspath(src_path))
 
-# src 내 모듈 import
-from collect.dart_collector import extract_and_save_data
-from proprecessing.proprecessed import standardize_company_data
-from validate.validator import validate_biz_numbers
-from transform.transformer import transform_with_metadata
-from export.exporter import export_to_csv
-
 from config import DART_API_KEY, NTS_API_KEY, DATA_PATH, BATCH_SIZE
 
+# 스케줄러가 DAG 파일을 파싱할 때마다 pandas/requests를 불러오지 않도록
+# src 내 모듈은 각 태스크 함수 안에서 import 합니다.
+
+def collect_data():
+    from collect.dart_collector import extract_and_save_data
+    extract_and_save_data(
+        api_key=DART_API_KEY, 
+        start_index=0, 
+        end_index=BATCH_SIZE, 
+        filename=f"{DATA_PATH}raw_dart_data.xlsx"
+    )
+
+def standardize_data():
+    from proprecessing.proprecessed import standardize_company_data
+    standardize_company_data(
+        f"{DATA_PATH}raw_dart_data.xlsx",
+        f"{DATA_PATH}proprecessed_company_data.xlsx"
+    )
+
+def validate_data():
+    from validate.validator import validate_biz_numbers
+    validate_biz_numbers(
+        f"{DATA_PATH}proprecessed_company_data.xlsx",
+        f"{DATA_PATH}validated_company_data.xlsx",
+        NTS_API_KEY,
+        spool_path=f"{DATA_PATH}failed_batches.jsonl"
+    )
+
+def capture_data_changes():
+    from transform.change_capture import capture_changes
+    capture_changes(
+        f"{DATA_PATH}validated_company_data.xlsx",
+        f"{DATA_PATH}master_snapshot.csv",
+        f"{DATA_PATH}company_changes.csv"
+    )
+
+def transform_data():
+    from transform.transformer import transform_with_metadata, transform_changes
+    from transform.change_capture import promote_snapshot
+    # 스냅샷이 없으면(첫 실행) DELETE를 알 수 없으므로 전체 변환
+    if os.path.exists(f"{DATA_PATH}master_snapshot.csv"):
+        transform_changes(
+            f"{DATA_PATH}company_changes.csv",
+            f"{DATA_PATH}metadata_delta.xlsx",
+            master_file=f"{DATA_PATH}metadata_enriched_data.xlsx"
+        )
+    else:
+        transform_with_metadata(
+            f"{DATA_PATH}validated_company_data.xlsx",
+            f"{DATA_PATH}metadata_enriched_data.xlsx"
+        )
+    promote_snapshot(f"{DATA_PATH}master_snapshot.csv")
+
+def build_query_store():
+    from query.company_store import build_company_store
+    build_company_store(
+        f"{DATA_PATH}metadata_enriched_data.xlsx",
+        f"{DATA_PATH}company_master.db"
+    )
+
 
 default_args = {
     'owner': 'seungil',
@@ -38,41 +91,38 @@ dag = DAG(
 
 t1 = PythonOperator(
     task_id='collect_data',
-    python_callable=lambda: extract_and_save_data(
-        api_key=DART_API_KEY, 
-        start_index=0, 
-        end_index=BATCH_SIZE, 
-        filename=f"{DATA_PATH}raw_dart_data.xlsx"
-    ),
+    python_callable=collect_data,
     dag=dag
 )
 
 t2 = PythonOperator(
     task_id='standardize_data',
-    python_callable=lambda: standardize_company_data(
-        f"{DATA_PATH}raw_dart_data.xlsx",
-        f"{DATA_PATH}proprecessed_company_data.xlsx"
-    ),
+    python_callable=standardize_data,
     dag=dag
 )
 
 t3 = PythonOperator(
     task_id='validate_data',
-    python_callable=lambda: validate_biz_numbers(
-        f"{DATA_PATH}proprecessed_company_data.xlsx",
-        f"{DATA_PATH}validated_company_data.xlsx",
-        NTS_API_KEY
-    ),
+    python_callable=validate_data,
     dag=dag
 )
 
 t4 = PythonOperator(
+    task_id='capture_changes',
+    python_callable=capture_data_changes,
+    dag=dag
+)
+
+t5 = PythonOperator(
     task_id='transform_data',
-    python_callable=lambda: transform_with_metadata(
-        f"{DATA_PATH}validated_company_data.xlsx",
-        f"{DATA_PATH}metadata_enriched_data.xlsx"
-    ),
+    python_callable=transform_data,
+    dag=dag
+)
+
+t6 = PythonOperator(
+    task_id='build_query_store',
+    python_callable=build_query_store,
     dag=dag
 )
 
-t1 >> t2 >> t3 >> t4
+t1 >> t2 >> t3 >> t4 >> t5 >> t6
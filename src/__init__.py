@@ -1,20 +1,24 @@
 """
 src 패키지: 전체 프로젝트의 소스 메인 패키지입니다.
 
-각 서브패키지(collect, standardize, validate, transform, export)의 주요 함수들을 임포트 하여
-src에서 바로 접근할 수 있도록 합니다.
+각 서브패키지(collect, standardize, validate, transform, export, query)의 주요 함수들을
+src에서 바로 접근할 수 있도록 합니다. 함수는 처음 접근할 때 임포트되므로
+`import src` 만으로는 pandas, requests 등 무거운 의존성을 불러오지 않습니다.
 """
-from .collect import *
-from .proprecessing import *
-from .validate import *
-from .transform import *
-from .export import *
+from . import collect, proprecessing, validate, transform, export, query
+
+_SUBPACKAGES = (collect, proprecessing, validate, transform, export, query)
 
 # 개별 패키지의 __all__을 합쳐서 전체 __all__ 정의
-__all__ = (
-    collect.__all__ +
-    proprecessing.__all__ +
-    validate.__all__ +
-    transform.__all__ +
-    export.__all__
-)
\ No newline at end of file
+__all__ = [name for package in _SUBPACKAGES for name in package.__all__]
+
+def __getattr__(name):
+    for package in _SUBPACKAGES:
+        if name in package.__all__:
+            value = getattr(package, name)
+            globals()[name] = value
+            return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -1,12 +1,34 @@
 """
 collect 패키지: 데이터 수집(ingest) 관련 모듈을 포함합니다.
-예시: OpenDART 등 외부 API에서 기업 데이터를 수집하는 기능 제공.
+예시: OpenDART 등 외부 API에서 기업 데이터를 수집하고, 추가 엔드포인트(재무, 최대주주)로 병렬 보강하는 기능 제공.
 """
-# dart_collector 모듈의 주요 함수 임포트
-from .dart_collector import get_corp_codes, get_company_info, extract_and_save_data
+import importlib
+
+# 주요 함수는 처음 접근할 때 임포트 (pandas/requests 로딩 지연)
+_LAZY_ATTRS = {
+    "get_corp_codes": ".dart_collector",
+    "get_company_info": ".dart_collector",
+    "extract_and_save_data": ".dart_collector",
+    "DartClient": ".enrichment",
+    "register_enricher": ".enrichment",
+    "enrich_company": ".enrichment"
+}
 
 __all__ = [
     "get_corp_codes",
     "get_company_info",
     "extract_and_save_data",
-]
\ No newline at end of file
+    "DartClient",
+    "register_enricher",
+    "enrich_company"
+]
+
+def __getattr__(name):
+    if name in _LAZY_ATTRS:
+        value = getattr(importlib.import_module(_LAZY_ATTRS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
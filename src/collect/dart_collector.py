@@ -7,8 +7,10 @@ import xmltodict
 import pandas as pd
 import zipfile
 import io
-import time
 import os
+from concurrent.futures import ThreadPoolExecutor
+
+from .enrichment import DartClient, ENRICHERS, DEFAULT_MAX_WORKERS, fan_out, get_default_client
 
 def get_corp_codes(api_key: str):
     """
@@ -28,20 +30,20 @@ def get_corp_codes(api_key: str):
             data = xmltodict.parse(xml_content)
     return data['result']['list']
 
-def get_company_info(api_key: str, corp_code: str):
+def get_company_info(api_key: str, corp_code: str, client: DartClient = None):
     """
     Extract key company information from the company.xml file.
     Args:
         api_key (str): OpenDART API key
         corp_code (str): Company unique code
+        client (DartClient, optional): Shared client (rate budget + response cache).
+            Defaults to the module-level client for `api_key`.
     Returns:
         dict: Company info
     """
-    url = f"https://opendart.fss.or.kr/api/company.xml?crtfc_key={api_key}&corp_code={corp_code}"
+    client = client or get_default_client(api_key)
     try:
-        response = requests.get(url)
-        response.raise_for_status()
-        xml_data = xmltodict.parse(response.content)
+        xml_data = xmltodict.parse(client.get("company.xml", corp_code=corp_code))
         return {
             'induty_code': xml_data['result'].get('induty_code'),
             'corp_name_eng': xml_data['result'].get('corp_name_eng'),
@@ -60,44 +62,53 @@ def get_company_info(api_key: str, corp_code: str):
         print(f"Error fetching company info for {corp_code}: {e}")
         return None
 
-def extract_and_save_data(api_key: str, start_index: int, end_index: int, filename: str = "company_info.xlsx"):
+def extract_and_save_data(api_key: str, start_index: int, end_index: int, filename: str = "company_info.xlsx",
+                          enrichers: list = None, bsns_year: str = None, max_workers: int = DEFAULT_MAX_WORKERS):
     """
     Extracts a range of company info and saves to an Excel file.
+    company.xml and the enrichment endpoints (default: all registered enrichers) are requested
+    concurrently per company, sharing one rate budget and response cache.
     """
     corp_codes = get_corp_codes(api_key)
+    enrichers = list(ENRICHERS) if enrichers is None else enrichers
+    client = get_default_client(api_key)
     data_list = []
 
-    for index, company in enumerate(corp_codes[start_index:end_index], start=start_index):
-        try:
-            corp_code = company['corp_code']
-            corp_name = company['corp_name']
-            stock_code = company['stock_code']
-            modify_date = company['modify_date']
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for index, company in enumerate(corp_codes[start_index:end_index], start=start_index):
+            try:
+                corp_code = company['corp_code']
+                corp_name = company['corp_name']
+                stock_code = company['stock_code']
+                modify_date = company['modify_date']
 
-            company_info = get_company_info(api_key, corp_code)
-            time.sleep(0.5)
+                # company.xml과 추가 엔드포인트를 한 번에 동시 요청
+                info_future = executor.submit(get_company_info, api_key, corp_code, client)
+                enrichment = fan_out(executor, client, corp_code, enrichers, bsns_year)
+                company_info = info_future.result()
 
-            if company_info:
-                data_list.append({
-                    '고유번호': corp_code,
-                    '정식명칭': corp_name,
-                    '종목코드': stock_code,
-                    '최종변경일자': modify_date,
-                    '업종코드': company_info['induty_code'],
-                    '영문명칭': company_info['corp_name_eng'],
-                    '약식명칭': company_info['stock_name'],
-                    '대표자명': company_info['ceo_nm'],
-                    '홈페이지': company_info['hm_url'],
-                    '주소': company_info['adres'],
-                    '전화번호': company_info['phn_no'],
-                    '팩스번호': company_info['fax_no'],
-                    '설립일': company_info['est_dt'],
-                    '사업자등록번호': company_info['bizr_no'],
-                    '법인구분': company_info['corp_cls'],
-                    '법인등록번호': company_info['jurir_no']
-                })
-        except Exception as e:
-            print(f"Error processing company {index}: {e}")
+                if company_info:
+                    data_list.append({
+                        '고유번호': corp_code,
+                        '정식명칭': corp_name,
+                        '종목코드': stock_code,
+                        '최종변경일자': modify_date,
+                        '업종코드': company_info['induty_code'],
+                        '영문명칭': company_info['corp_name_eng'],
+                        '약식명칭': company_info['stock_name'],
+                        '대표자명': company_info['ceo_nm'],
+                        '홈페이지': company_info['hm_url'],
+                        '주소': company_info['adres'],
+                        '전화번호': company_info['phn_no'],
+                        '팩스번호': company_info['fax_no'],
+                        '설립일': company_info['est_dt'],
+                        '사업자등록번호': company_info['bizr_no'],
+                        '법인구분': company_info['corp_cls'],
+                        '법인등록번호': company_info['jurir_no'],
+                        **enrichment
+                    })
+            except Exception as e:
+                print(f"Error processing company {index}: {e}")
 
     df = pd.DataFrame(data_list)
     df.to_excel(filename, index=False, engine='openpyxl')
@@ -0,0 +1,248 @@
+"""
+Parallel enrichment of company records with additional OpenDART endpoints.
+All requests for one company are issued concurrently and share a single rate budget
+and response cache, so enriching a company costs one round of overlapped requests.
+New endpoints are added by registering an enricher with `register_enricher`.
+"""
+
+import json
+import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+import requests
+
+DART_API_BASE = "https://opendart.fss.or.kr/api/"
+DEFAULT_RATE_PER_SEC = 5
+DEFAULT_MAX_WORKERS = 4
+DEFAULT_CACHE_SIZE = 1024
+
+# 캐시해도 되는 OpenDART 상태 코드 (000: 정상, 013: 조회된 데이터 없음).
+# 020(요청 제한 초과), 800(시스템 점검) 등 일시적 오류는 캐시하지 않음
+CACHEABLE_STATUSES = {"000", "013"}
+
+# 사업보고서 보고서 코드
+ANNUAL_REPORT_CODE = "11011"
+
+# 중소기업기본법 규모 기준: 자산총계 5천억원 이상이면 중소기업 제외
+SME_ASSET_CEILING = 500_000_000_000
+
+def default_business_years():
+    """
+    Business years to try for annual reports when none is given: last year, then the year before.
+    """
+    this_year = datetime.now().year
+    return [str(this_year - 1), str(this_year - 2)]
+
+class RateLimiter:
+    """
+    Thread-safe limiter that spaces requests evenly at `rate_per_sec`.
+    """
+
+    def __init__(self, rate_per_sec=DEFAULT_RATE_PER_SEC):
+        self.interval = 1.0 / rate_per_sec
+        self.lock = threading.Lock()
+        self.next_time = time.monotonic()
+
+    def wait(self):
+        with self.lock:
+            now = time.monotonic()
+            wait_time = self.next_time - now
+            self.next_time = max(now, self.next_time) + self.interval
+        if wait_time > 0:
+            time.sleep(wait_time)
+
+def dart_status(endpoint, content):
+    """
+    Extract the OpenDART status code from a JSON or XML response body (None if absent).
+    """
+    if endpoint.endswith(".json"):
+        try:
+            return json.loads(content).get("status")
+        except ValueError:
+            return None
+    match = re.search(rb"<status>\s*(\d+)\s*</status>", content)
+    return match.group(1).decode() if match else None
+
+_default_clients = {}
+_default_clients_lock = threading.Lock()
+
+def get_default_client(api_key):
+    """
+    Module-level client per API key, so callers without an explicit client
+    still share one rate budget, cache and HTTP session.
+    """
+    with _default_clients_lock:
+        if api_key not in _default_clients:
+            _default_clients[api_key] = DartClient(api_key)
+        return _default_clients[api_key]
+
+class DartClient:
+    """
+    OpenDART client shared by the collector and all enrichers.
+    Every request passes through the same rate limiter and a bounded LRU response cache.
+    """
+
+    def __init__(self, api_key, rate_per_sec=DEFAULT_RATE_PER_SEC, cache_size=DEFAULT_CACHE_SIZE):
+        self.api_key = api_key
+        self.session = requests.Session()
+        self.limiter = RateLimiter(rate_per_sec)
+        self.cache = OrderedDict()
+        self.cache_size = cache_size
+        self.cache_lock = threading.Lock()
+
+    def get(self, endpoint, **params):
+        """
+        GET an OpenDART endpoint and return the raw response body.
+        Only responses with a cacheable DART status are cached (per endpoint/params).
+        """
+        key = (endpoint, tuple(sorted(params.items())))
+        with self.cache_lock:
+            if key in self.cache:
+                self.cache.move_to_end(key)
+                return self.cache[key]
+
+        self.limiter.wait()
+        response = self.session.get(
+            DART_API_BASE + endpoint,
+            params={"crtfc_key": self.api_key, **params},
+            timeout=10
+        )
+        response.raise_for_status()
+
+        if dart_status(endpoint, response.content) in CACHEABLE_STATUSES:
+            with self.cache_lock:
+                self.cache[key] = response.content
+                while len(self.cache) > self.cache_size:
+                    self.cache.popitem(last=False)
+        return response.content
+
+    def get_list(self, endpoint, **params):
+        """
+        GET a JSON endpoint and return its 'list' items ([] when DART has no data).
+        """
+        result = json.loads(self.get(endpoint, **params))
+        status = result.get("status")
+        if status == "013":  # 조회된 데이터 없음
+            return []
+        if status != "000":
+            raise ValueError(f"OpenDART {endpoint} error {status}: {result.get('message')}")
+        return result.get("list", [])
+
+    def get_annual_list(self, endpoint, corp_code, bsns_year=None):
+        """
+        GET an annual report (사업보고서) endpoint.
+        Without an explicit `bsns_year`, last year is tried first and, if DART has no data (013),
+        the year before: annual reports are only filed by the end of March.
+        Returns:
+            list: 'list' items of the first year that has data ([] if none).
+        """
+        years = [bsns_year] if bsns_year else default_business_years()
+        for year in years:
+            items = self.get_list(endpoint, corp_code=corp_code, bsns_year=year, reprt_code=ANNUAL_REPORT_CODE)
+            if items:
+                return items
+        return []
+
+ENRICHERS = {}
+
+def register_enricher(name):
+    """
+    Register an enricher: a function (client, corp_code, bsns_year) -> dict of fields to merge.
+    `bsns_year` may be None; use `client.get_annual_list` to get the default year fallback.
+    """
+    def decorator(func):
+        ENRICHERS[name] = func
+        return func
+    return decorator
+
+def _parse_amount(value):
+    if value is None:
+        return None
+    value = str(value).replace(",", "").strip()
+    return int(value) if value.lstrip("-").isdigit() else None
+
+def classify_sme(revenue, total_assets):
+    """
+    Decide 중소기업여부 only where financials alone are conclusive (1: 대기업, None: 판단 불가).
+    Total assets of 5천억원 or more rule out SME status. Confirming an SME (0) also needs
+    the independence criterion (e.g. not a subsidiary of a large group), which DART
+    financials do not provide, so it is never returned here.
+    """
+    if total_assets is not None and total_assets >= SME_ASSET_CEILING:
+        return 1
+    return None
+
+@register_enricher("financial_summary")
+def enrich_financial_summary(client, corp_code, bsns_year):
+    """
+    Revenue and total assets from the annual report (fnlttSinglAcnt), preferring separate statements.
+    """
+    items = client.get_annual_list("fnlttSinglAcnt.json", corp_code, bsns_year)
+    accounts = {}
+    for fs_div in ("CFS", "OFS"):  # OFS(별도)가 있으면 덮어씀
+        for item in items:
+            if item.get("fs_div") == fs_div:
+                accounts[item.get("account_nm")] = _parse_amount(item.get("thstrm_amount"))
+    revenue = accounts.get("매출액")
+    total_assets = accounts.get("자산총계")
+    return {
+        "매출액": revenue,
+        "자산총계": total_assets,
+        "중소기업여부": classify_sme(revenue, total_assets),
+    }
+
+@register_enricher("major_shareholder")
+def enrich_major_shareholder(client, corp_code, bsns_year):
+    """
+    Largest shareholder and stake from the annual report (hyslrSttus).
+    """
+    items = client.get_annual_list("hyslrSttus.json", corp_code, bsns_year)
+    holders = [item for item in items if item.get("nm") not in (None, "계")]
+    if not holders:
+        return {}
+    principal = next((item for item in holders if item.get("relate") == "본인"), holders[0])
+    return {
+        "최대주주명": principal.get("nm"),
+        "최대주주지분율": principal.get("trmend_posesn_stock_qota_rt"),
+    }
+
+def _run_enricher(name, client, corp_code, bsns_year):
+    try:
+        return ENRICHERS[name](client, corp_code, bsns_year)
+    except Exception as e:
+        print(f"Error enriching {corp_code} with {name}: {e}")
+        return {}
+
+def fan_out(executor, client, corp_code, tasks, bsns_year=None):
+    """
+    Submit all enrichers for one company at once and merge their results.
+    Args:
+        executor (ThreadPoolExecutor): Shared executor.
+        client (DartClient): Shared client (rate budget + cache).
+        corp_code (str): Company unique code.
+        tasks (list): Enricher names.
+        bsns_year (str): Business year of the reports (default: last year, falling back to the year before).
+    Returns:
+        dict: Merged enrichment fields.
+    """
+    futures = [executor.submit(_run_enricher, name, client, corp_code, bsns_year) for name in tasks]
+    merged = {}
+    for future in futures:
+        merged.update(future.result())
+    return merged
+
+def enrich_company(client, corp_code, enrichers=None, bsns_year=None, max_workers=DEFAULT_MAX_WORKERS):
+    """
+    Enrich a single company with the given (default: all registered) enrichers.
+    """
+    enrichers = list(ENRICHERS) if enrichers is None else enrichers
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return fan_out(executor, client, corp_code, enrichers, bsns_year)
+
+# Example usage:
+# client = DartClient("YOUR_DART_API_KEY")
+# enrich_company(client, "00126380")
@@ -2,8 +2,23 @@
 export 패키지: 데이터 내보내기(Export) 전용 모듈을 포함합니다.
 예시: Excel, CSV 등 다양한 포맷으로 데이터 저장.
 """
-from .exporter import export_to_csv
+import importlib
+
+# 주요 함수는 처음 접근할 때 임포트 (pandas 로딩 지연)
+_LAZY_ATTRS = {
+    "export_to_csv": ".exporter"
+}
 
 __all__ = [
     "export_to_csv"
-]
\ No newline at end of file
+]
+
+def __getattr__(name):
+    if name in _LAZY_ATTRS:
+        value = getattr(importlib.import_module(_LAZY_ATTRS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
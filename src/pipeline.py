@@ -2,14 +2,24 @@
 Main pipeline script to process business registration master data.
 """
 
+import os
+import sys
+
+# src 폴더 경로를 PYTHONPATH에 추가 (Airflow DAG와 동일하게, 단계 간 공통 모듈은 최상위 이름으로 import)
+src_path = os.path.dirname(os.path.abspath(__file__))
+if src_path not in sys.path:
+    sys.path.append(src_path)
+
 # config에서 API키 등 환경설정 가져오기
 from src.config import DART_API_KEY, NTS_API_KEY, DATA_PATH, BATCH_SIZE
 
 from src.collect.dart_collector import extract_and_save_data
 from src.proprecessing.proprecessed import standardize_company_data
-from src.validate.validator import validate_biz_numbers
-from src.transform.transformer import transform_with_metadata
+from src.validate.validator import validate_biz_numbers, replay_failed_batches
+from src.transform.transformer import transform_with_metadata, transform_changes
+from src.transform.change_capture import capture_changes, promote_snapshot
 from src.export.exporter import export_to_csv
+from src.query.company_store import build_company_store
 
 def main():
     # 1. Data Collection
@@ -30,20 +40,60 @@ def main():
     validate_biz_numbers(
         f"{DATA_PATH}proprecessed_company_data.xlsx", 
         f"{DATA_PATH}validated_company_data.xlsx", 
-        NTS_API_KEY
+        NTS_API_KEY,
+        spool_path=f"{DATA_PATH}failed_batches.jsonl"
     )
     
-    # 4. Transformation
-    transform_with_metadata(
-        f"{DATA_PATH}validated_company_data.xlsx", 
-        f"{DATA_PATH}metadata_enriched_data.xlsx"
+    # 4. Change capture (이전 실행 스냅샷 대비 변경분 추출)
+    has_snapshot = os.path.exists(f"{DATA_PATH}master_snapshot.csv")
+    capture_changes(
+        f"{DATA_PATH}validated_company_data.xlsx",
+        f"{DATA_PATH}master_snapshot.csv",
+        f"{DATA_PATH}company_changes.csv"
     )
+
+    # 5. Transformation (스냅샷이 있으면 변경된 기업만 다시 변환)
+    if has_snapshot:
+        transform_changes(
+            f"{DATA_PATH}company_changes.csv",
+            f"{DATA_PATH}metadata_delta.xlsx",
+            master_file=f"{DATA_PATH}metadata_enriched_data.xlsx"
+        )
+    else:
+        transform_with_metadata(
+            f"{DATA_PATH}validated_company_data.xlsx", 
+            f"{DATA_PATH}metadata_enriched_data.xlsx"
+        )
+    # 변환이 끝난 뒤에만 이번 실행 결과를 다음 비교 기준으로 확정
+    promote_snapshot(f"{DATA_PATH}master_snapshot.csv")
     
-    # 5. Export
+    # 6. Export
     export_to_csv(
         f"{DATA_PATH}metadata_enriched_data.xlsx", 
         f"{DATA_PATH}final_output.csv"
     )
+    if has_snapshot:
+        export_to_csv(
+            f"{DATA_PATH}metadata_delta.xlsx",
+            f"{DATA_PATH}final_output_delta.csv"
+        )
+
+    # 7. Query store (인덱스 기반 기업 조회용 SQLite)
+    build_company_store(
+        f"{DATA_PATH}metadata_enriched_data.xlsx",
+        f"{DATA_PATH}company_master.db"
+    )
+
+def replay():
+    # 실패한 국세청 검증 배치만 재검증 후 결과 파일 갱신
+    replay_failed_batches(
+        f"{DATA_PATH}validated_company_data.xlsx",
+        NTS_API_KEY,
+        spool_path=f"{DATA_PATH}failed_batches.jsonl"
+    )
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    if "--replay" in sys.argv:
+        replay()
+    else:
+        main()
\ No newline at end of file
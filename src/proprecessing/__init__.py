@@ -1,9 +1,37 @@
 """
 standardize 패키지: 데이터 표준화(Cleaning/Standardization) 관련 모듈을 포함합니다.
-예시: 컬럼별 정제, 표준 포맷 변환 등.
+예시: 컬럼별 정제, 표준 포맷 변환, 단계 간 공통으로 쓰는 메모리 절약형 스키마 등.
 """
-from .proprecessed import standardize_company_data
+import importlib
+
+# 주요 함수는 처음 접근할 때 임포트 (pandas 로딩 지연)
+# schema는 모든 단계가 같은 모듈 객체를 쓰도록 최상위 이름(proprecessing.schema)으로 임포트
+_LAZY_ATTRS = {
+    "standardize_company_data": ".proprecessed",
+    "compact_company_frame": "proprecessing.schema",
+    "expand_company_frame": "proprecessing.schema",
+    "read_company_excel": "proprecessing.schema",
+    "write_company_excel": "proprecessing.schema",
+    "bytes_per_row": "proprecessing.schema",
+    "memory_report": "proprecessing.schema"
+}
 
 __all__ = [
-    "standardize_company_data"
-]
\ No newline at end of file
+    "standardize_company_data",
+    "compact_company_frame",
+    "expand_company_frame",
+    "read_company_excel",
+    "write_company_excel",
+    "bytes_per_row",
+    "memory_report"
+]
+
+def __getattr__(name):
+    if name in _LAZY_ATTRS:
+        value = getattr(importlib.import_module(_LAZY_ATTRS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
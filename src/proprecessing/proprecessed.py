@@ -8,6 +8,8 @@ If homepage is present and does not start with http(s), "https://" is prepended.
 import pandas as pd
 import re
 
+from proprecessing.schema import compact_company_frame, write_company_excel, bytes_per_row, memory_report
+
 def clean_homepage(x):
     """
     Clean homepage field:
@@ -127,36 +129,17 @@ def standardize_company_data(input_path, output_path):
     # Add other columns as None
     df['본지점여부'] = None
     df['본지점일괄납부여부'] = None
-    df['중소기업여부'] = None
+    # 중소기업여부 is filled by the collect stage enrichment when available
+    if '중소기업여부' not in df.columns:
+        df['중소기업여부'] = None
     df['사업자등록번호 유효성'] = None
 
-    # Set column types explicitly
-    df = df.astype({
-        '사업자등록번호': 'string',
-        '고유번호': 'string',
-        '정식명칭': 'string',
-        '종목코드': 'string',
-        '최종변경일자': 'string',
-        '업종코드': 'string',
-        '영문명칭': 'string',
-        '약식명칭': 'string',
-        '대표자명': 'string',
-        '홈페이지': 'string',
-        '주소': 'string',
-        '전화번호': 'string',
-        '팩스번호': 'string',
-        '설립일': 'string',
-        '법인구분': 'string',
-        '법인등록번호': 'string',
-        '사업자등록번호 유효성': 'string',
-        '공동사업자여부': 'Int16',
-        '본지점여부': 'Int16',
-        '본지점일괄납부여부': 'Int16',
-        '중소기업여부': 'Int16',
-        '사업자등록번호 유효성': 'Int16'
-    })
-
-    df.to_excel(output_path, index=False, engine='openpyxl')
+    # Convert to the compact schema shared by every stage
+    before_bytes = bytes_per_row(df, as_object=True)
+    df = compact_company_frame(df)
+    memory_report(before_bytes, bytes_per_row(df))
+
+    write_company_excel(df, output_path)
     print(f"Cleaned data saved to {output_path}")
 
 # Example usage:
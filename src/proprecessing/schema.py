@@ -0,0 +1,128 @@
+"""
+Compact in-memory schema for company master data shared by every stage.
+- Free text: string[pyarrow]
+- Low-cardinality codes and 0/1 flags: category
+- Fixed-width digit fields (dates, registration numbers): packed unsigned integers,
+  zero-padded back to their original width whenever data is written out.
+- Amounts (financial enrichment): Int64
+"""
+
+import pandas as pd
+
+TEXT_COLUMNS = [
+    '정식명칭', '종목코드', '영문명칭', '약식명칭', '대표자명', '홈페이지', '주소', '전화번호', '팩스번호'
+]
+CATEGORY_COLUMNS = ['업종코드', '법인구분']
+FLAG_COLUMNS = ['공동사업자여부', '본지점여부', '본지점일괄납부여부', '중소기업여부', '사업자등록번호 유효성']
+
+# 자릿수가 고정된 숫자 필드: 정수로 저장하고 출력 시 원래 자릿수로 0을 채움
+FIXED_WIDTH_COLUMNS = {
+    '사업자등록번호': (10, 'UInt64'),
+    '법인등록번호': (13, 'UInt64'),
+    '고유번호': (8, 'UInt32'),
+    '설립일': (8, 'UInt32'),
+    '최종변경일자': (8, 'UInt32'),
+}
+
+# 금액 필드 (collect 단계 재무 정보 보강)
+INTEGER_COLUMNS = ['매출액', '자산총계']
+
+FLAG_DTYPE = pd.CategoricalDtype([0, 1])
+
+def _pack_digits(series, width, dtype):
+    """
+    Pack a digit-only column into an unsigned integer column.
+    Non-digit values and values longer than the field width become NA.
+    """
+    text = series.astype('string').str.replace('-', '', regex=False).str.strip()
+    valid = text.str.fullmatch(r'\d+').fillna(False) & (text.str.len() <= width).fillna(False)
+    return pd.to_numeric(text.where(valid)).astype(dtype)
+
+def compact_company_frame(df):
+    """
+    Convert company data (typically read with dtype=str) to the compact schema, column by column
+    in place, so each original column is released as soon as it has been converted.
+    Columns that are not part of the schema are stored as string[pyarrow].
+    Args:
+        df (pd.DataFrame): Company data (modified in place).
+    Returns:
+        pd.DataFrame: The same frame, now in the compact schema.
+    """
+    for col in df.columns:
+        if col in FIXED_WIDTH_COLUMNS:
+            df[col] = _pack_digits(df[col], *FIXED_WIDTH_COLUMNS[col])
+        elif col in INTEGER_COLUMNS:
+            amounts = df[col].astype('string').str.strip()
+            # Int64 범위(18자리)를 넘는 값은 NA 처리
+            amounts = amounts.where((amounts.str.len() <= 18).fillna(False))
+            df[col] = pd.to_numeric(amounts, errors='coerce').astype('Int64')
+        elif col in FLAG_COLUMNS:
+            flags = pd.to_numeric(df[col].astype('string'), errors='coerce')
+            df[col] = flags.where(flags.isin([0, 1])).astype('Int8').astype(FLAG_DTYPE)
+        elif col in CATEGORY_COLUMNS:
+            df[col] = df[col].astype('string[pyarrow]').astype('category')
+        else:
+            df[col] = df[col].astype('string[pyarrow]')
+    return df
+
+def format_fixed_width(series, width):
+    """
+    Render a packed digit column back into zero-padded strings.
+    """
+    return series.astype('UInt64').astype('string').str.zfill(width)
+
+def expand_company_frame(df):
+    """
+    Convert a compact frame back to plain strings/integers for writing (Excel/CSV)
+    or row-wise processing. Packed digit fields are zero-padded to their original width.
+    """
+    df = df.copy()
+    for col in df.columns:
+        if col in FIXED_WIDTH_COLUMNS:
+            df[col] = format_fixed_width(pd.to_numeric(df[col]), FIXED_WIDTH_COLUMNS[col][0]).astype(object)
+        elif col in INTEGER_COLUMNS:
+            df[col] = pd.to_numeric(df[col].astype(object)).astype('Int64').astype(object)
+        elif col in FLAG_COLUMNS:
+            df[col] = pd.to_numeric(df[col].astype(object)).astype('Int8').astype(object)
+        else:
+            df[col] = df[col].astype(object)
+    return df.where(df.notna(), None)
+
+def read_company_excel(path):
+    """
+    Read a company data Excel file and convert it to the compact schema.
+    The reduction applies once loading is done: the Excel parse itself still
+    materializes every cell as a string before the columns are packed.
+    """
+    return compact_company_frame(pd.read_excel(path, dtype=str))
+
+def write_company_excel(df, path):
+    """
+    Write a compact company frame to Excel with packed fields expanded.
+    """
+    expand_company_frame(df).to_excel(path, index=False, engine='openpyxl')
+
+def bytes_per_row(df, as_object=False):
+    """
+    In-memory size of a frame per row. With `as_object=True` each column is measured
+    as Python object strings, i.e. the representation stages used before the compact schema.
+    """
+    rows = max(len(df), 1)
+    total = sum(
+        (df[col].astype(object) if as_object else df[col]).memory_usage(deep=True, index=False)
+        for col in df.columns
+    )
+    return total / rows
+
+def memory_report(before_bytes, after_bytes):
+    """
+    Print and return the bytes per row before/after compaction.
+    Args:
+        before_bytes (float): Bytes per row of the original representation.
+        after_bytes (float): Bytes per row of the compact representation.
+    Returns:
+        dict: bytes per row before/after and the reduction ratio.
+    """
+    ratio = before_bytes / after_bytes if after_bytes else float('inf')
+    print(f"[메모리] {before_bytes:.0f} → {after_bytes:.0f} bytes/row ({ratio:.1f}x 감소)")
+    return {'before_bytes_per_row': before_bytes, 'after_bytes_per_row': after_bytes, 'ratio': ratio}
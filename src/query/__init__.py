@@ -0,0 +1,26 @@
+"""
+query 패키지: 최종 마스터 테이블에 대한 인덱스 기반 기업 조회 기능을 제공합니다.
+예시: 사업자등록번호/고유번호/종목코드 조회, 기업명 prefix 및 n-gram 검색, 일괄 조회.
+"""
+import importlib
+
+# 주요 함수는 처음 접근할 때 임포트 (pandas 로딩 지연)
+_LAZY_ATTRS = {
+    "build_company_store": ".company_store",
+    "CompanyStore": ".company_store"
+}
+
+__all__ = [
+    "build_company_store",
+    "CompanyStore"
+]
+
+def __getattr__(name):
+    if name in _LAZY_ATTRS:
+        value = getattr(importlib.import_module(_LAZY_ATTRS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
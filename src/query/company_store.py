@@ -0,0 +1,220 @@
+"""
+Index-backed company lookup over the master table produced by the transform stage.
+The long metadata table is pivoted back into one row per company and stored in SQLite
+with B-tree indexes for point lookups and a bigram table for Korean company name search.
+"""
+
+import os
+import sqlite3
+
+import pandas as pd
+
+# 인덱스 range 검색 상한 (prefix 뒤에 붙여 "prefix로 시작하는 모든 문자열"을 표현)
+MAX_CHAR = chr(0x10FFFF)
+NAME_COLUMNS = ['OFCLNM', 'SHTNM']
+LOOKUP_BATCH_SIZE = 500
+
+def normalize_name(name):
+    """
+    Normalize a company name for n-gram search: remove whitespace, lowercase.
+    """
+    if name is None or pd.isna(name):
+        return ''
+    return ''.join(str(name).split()).lower()
+
+def name_grams(name):
+    """
+    Split a normalized name into bigrams. A trailing space is appended so that
+    every character is the first character of at least one gram (single-character search).
+    """
+    padded = name + ' '
+    return {padded[i:i + 2] for i in range(len(name))}
+
+def _normalize_corp_code(value):
+    """
+    OpenDART 고유번호 is 8 digits; restore leading zeros lost in Excel round-trips.
+    """
+    if value is None or pd.isna(value):
+        return None
+    value = str(value).strip()
+    return value.zfill(8) if value.isdigit() else value
+
+def load_master_table(input_file):
+    """
+    Pivot the long metadata table (Excel or CSV) back into one row per company.
+    Args:
+        input_file (str): Path to the transform/export output.
+    Returns:
+        tuple: (wide pd.DataFrame with physical column names, set of SMALLINT columns)
+    """
+    if str(input_file).endswith('.csv'):
+        long_df = pd.read_csv(input_file, dtype=str, encoding='utf-8-sig')
+    else:
+        long_df = pd.read_excel(input_file, dtype=str)
+    long_df = long_df[long_df['물리컬럼명'].notna()]
+
+    long_df = long_df.assign(block_id=(pd.to_numeric(long_df['순번']) == 1).cumsum())
+    columns = long_df['물리컬럼명'].drop_duplicates().tolist()
+    wide = long_df.pivot(index='block_id', columns='물리컬럼명', values='데이터').reindex(columns=columns)
+    wide = wide.reset_index(drop=True)
+    smallint_columns = set(long_df.loc[long_df['데이터 타입'] == 'SMALLINT', '물리컬럼명'])
+    return wide, smallint_columns
+
+def build_company_store(input_file, db_path):
+    """
+    Build the SQLite company store from the transform output.
+    The database is written to a temporary file and swapped in atomically,
+    so readers never see a half-built store.
+    Args:
+        input_file (str): Path to the metadata-rich master table (Excel or CSV).
+        db_path (str): Path to the SQLite database to create.
+    Returns:
+        int: Number of companies stored.
+    """
+    wide, smallint_columns = load_master_table(input_file)
+    if 'UNIQNO' in wide.columns:
+        wide['UNIQNO'] = wide['UNIQNO'].map(_normalize_corp_code)
+    for col in smallint_columns:
+        wide[col] = pd.to_numeric(wide[col], errors='coerce').astype('Int64')
+    wide = wide.astype(object).where(wide.notna(), None)
+
+    tmp_path = f"{db_path}.tmp"
+    if os.path.exists(tmp_path):
+        os.remove(tmp_path)
+
+    columns = wide.columns.tolist()
+    column_defs = ', '.join(
+        f'"{col}" INTEGER' if col in smallint_columns else f'"{col}" TEXT' for col in columns
+    )
+    column_names = ', '.join(f'"{col}"' for col in columns)
+    placeholders = ', '.join('?' for _ in columns)
+
+    conn = sqlite3.connect(tmp_path)
+    try:
+        conn.execute(f'CREATE TABLE company (company_id INTEGER PRIMARY KEY, {column_defs})')
+        conn.executemany(
+            f'INSERT INTO company (company_id, {column_names}) VALUES (?, {placeholders})',
+            ((i, *row) for i, row in enumerate(wide.itertuples(index=False, name=None)))
+        )
+
+        conn.execute('CREATE TABLE company_name_gram (gram TEXT, company_id INTEGER, PRIMARY KEY (gram, company_id)) WITHOUT ROWID')
+        name_columns = [col for col in NAME_COLUMNS if col in columns]
+        grams = set()
+        for company_id, names in enumerate(wide[name_columns].itertuples(index=False, name=None)):
+            for name in names:
+                grams.update((gram, company_id) for gram in name_grams(normalize_name(name)))
+        conn.executemany('INSERT INTO company_name_gram (gram, company_id) VALUES (?, ?)', grams)
+
+        for col in ['BIZRGNO', 'UNIQNO', 'ITMCD', 'OFCLNM']:
+            if col in columns:
+                conn.execute(f'CREATE INDEX idx_company_{col.lower()} ON company ("{col}")')
+        conn.commit()
+    finally:
+        conn.close()
+
+    os.replace(tmp_path, db_path)
+    print(f"Company store with {len(wide)} companies saved to {db_path}")
+    return len(wide)
+
+class CompanyStore:
+    """
+    Read-only query API over a store built by `build_company_store`.
+    Every lookup is served from an index (O(log n)); results are dicts keyed by physical column name.
+    """
+
+    def __init__(self, db_path):
+        self.conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _select(self, where, params, suffix=''):
+        rows = self.conn.execute(f'SELECT * FROM company WHERE {where} {suffix}', params).fetchall()
+        return [{key: row[key] for key in row.keys() if key != 'company_id'} for row in rows]
+
+    def find_by_biz_no(self, biz_no):
+        """
+        Look up companies by 사업자등록번호 (dashes are ignored).
+        """
+        return self._select('BIZRGNO = ?', (str(biz_no).replace('-', ''),))
+
+    def find_by_corp_code(self, corp_code):
+        """
+        Look up companies by OpenDART 고유번호.
+        """
+        return self._select('UNIQNO = ?', (_normalize_corp_code(corp_code),))
+
+    def find_by_stock_code(self, stock_code):
+        """
+        Look up companies by 종목코드.
+        """
+        return self._select('ITMCD = ?', (str(stock_code).strip(),))
+
+    def find_many_by_biz_no(self, biz_numbers):
+        """
+        Batch lookup by 사업자등록번호.
+        Returns:
+            dict: 사업자등록번호 → list of matching companies (missing numbers map to []).
+        """
+        keys = list(dict.fromkeys(str(b).replace('-', '') for b in biz_numbers))
+        result = {key: [] for key in keys}
+        for i in range(0, len(keys), LOOKUP_BATCH_SIZE):
+            batch = keys[i:i + LOOKUP_BATCH_SIZE]
+            placeholders = ', '.join('?' for _ in batch)
+            for company in self._select(f'BIZRGNO IN ({placeholders})', batch):
+                result[company['BIZRGNO']].append(company)
+        return result
+
+    def search_name_prefix(self, prefix, limit=20):
+        """
+        Companies whose 정식명칭 starts with `prefix`, served by an index range scan.
+        """
+        prefix = str(prefix).strip()
+        return self._select(
+            'OFCLNM >= ? AND OFCLNM < ?', (prefix, prefix + MAX_CHAR), f'ORDER BY OFCLNM LIMIT {int(limit)}'
+        )
+
+    def search_name(self, query, limit=20):
+        """
+        Companies whose 정식명칭 or 약식명칭 contains `query` (whitespace/case-insensitive),
+        using the bigram index to narrow candidates.
+        """
+        normalized = normalize_name(query)
+        if not normalized:
+            return []
+        if len(normalized) == 1:
+            candidate_sql = 'SELECT DISTINCT company_id FROM company_name_gram WHERE gram >= ? AND gram < ?'
+            params = (normalized, normalized + MAX_CHAR)
+        else:
+            grams = sorted({normalized[i:i + 2] for i in range(len(normalized) - 1)})
+            placeholders = ', '.join('?' for _ in grams)
+            candidate_sql = (
+                f'SELECT company_id FROM company_name_gram WHERE gram IN ({placeholders}) '
+                f'GROUP BY company_id HAVING COUNT(*) = {len(grams)}'
+            )
+            params = grams
+
+        candidates = self.conn.execute(
+            f'SELECT * FROM company WHERE company_id IN ({candidate_sql}) ORDER BY OFCLNM', params
+        )
+        results = []
+        for row in candidates:
+            # 바이그램이 모두 있어도 순서가 다를 수 있으므로 실제 포함 여부 확인
+            if any(normalized in normalize_name(row[col]) for col in NAME_COLUMNS if col in row.keys()):
+                results.append({key: row[key] for key in row.keys() if key != 'company_id'})
+                if len(results) >= limit:
+                    break
+        return results
+
+# Example usage:
+# build_company_store('data/metadata_enriched_data.xlsx', 'data/company_master.db')
+# with CompanyStore('data/company_master.db') as store:
+#     store.find_by_biz_no('3128134722')
+#     store.search_name('하이닉스')
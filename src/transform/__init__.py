@@ -1,9 +1,32 @@
 """
 transform 패키지: 데이터 통합/형 변환 및 마스터 테이블 구조 변환을 담당합니다.
-예시: 메타 테이블 변환, 컬럼 매핑, 타입 변환 등.
+예시: 메타 테이블 변환, 컬럼 매핑, 타입 변환, 실행 간 변경분(CDC) 추출 등.
 """
-from .transformer import transform_with_metadata
+import importlib
+
+# 주요 함수는 처음 접근할 때 임포트 (pandas 로딩 지연)
+_LAZY_ATTRS = {
+    "transform_with_metadata": ".transformer",
+    "transform_changes": ".transformer",
+    "compute_changes": ".change_capture",
+    "capture_changes": ".change_capture",
+    "promote_snapshot": ".change_capture"
+}
 
 __all__ = [
-    "transform_with_metadata"
-]
\ No newline at end of file
+    "transform_with_metadata",
+    "transform_changes",
+    "compute_changes",
+    "capture_changes",
+    "promote_snapshot"
+]
+
+def __getattr__(name):
+    if name in _LAZY_ATTRS:
+        value = getattr(importlib.import_module(_LAZY_ATTRS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
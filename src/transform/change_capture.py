@@ -0,0 +1,129 @@
+"""
+Record-level change data capture between pipeline runs.
+The validated master table of the current run is compared against the snapshot
+of the previous run, keyed on 사업자등록번호/고유번호, using vectorized row hashes.
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+
+from proprecessing.schema import compact_company_frame, expand_company_frame, read_company_excel
+
+KEY_COLUMNS = ['사업자등록번호', '고유번호']
+CHANGE_TYPE_COLUMN = '변경구분'
+CHANGED_COLUMNS_COLUMN = '변경컬럼'
+
+def _row_hashes(df, columns):
+    """
+    Hash every row of the given columns into a single uint64.
+    """
+    return pd.util.hash_pandas_object(df[columns], index=False).to_numpy()
+
+def _column_equal(a, b):
+    """
+    Element-wise equality of two aligned columns, treating missing == missing.
+    Works across differing categorical categories and nullable dtypes.
+    """
+    a = a.astype(object).to_numpy()
+    b = b.astype(object).to_numpy()
+    a_na, b_na = pd.isna(a), pd.isna(b)
+    both = ~a_na & ~b_na
+    equal = a_na & b_na
+    equal[both] = a[both] == b[both]
+    return equal
+
+def compute_changes(previous, current):
+    """
+    Compute inserts, updates (with changed column names) and deletes between two master tables.
+    Args:
+        previous (pd.DataFrame): Master table of the previous run.
+        current (pd.DataFrame): Master table of the current run.
+    Returns:
+        pd.DataFrame: Delta with '변경구분' (INSERT/UPDATE/DELETE) and '변경컬럼'.
+            Inserted and updated rows carry the full current record, deleted rows only the key.
+    """
+    columns = list(dict.fromkeys(list(current.columns) + list(previous.columns)))
+    value_columns = [col for col in columns if col not in KEY_COLUMNS]
+
+    prev = previous.reindex(columns=columns).drop_duplicates(KEY_COLUMNS, keep='last').set_index(KEY_COLUMNS)
+    cur = current.reindex(columns=columns).drop_duplicates(KEY_COLUMNS, keep='last').set_index(KEY_COLUMNS)
+
+    inserted = cur.index.difference(prev.index, sort=False)
+    deleted = prev.index.difference(cur.index, sort=False)
+    common = cur.index.intersection(prev.index, sort=False)
+
+    cur_common = cur.loc[common, value_columns]
+    prev_common = prev.loc[common, value_columns]
+    changed = _row_hashes(cur_common, value_columns) != _row_hashes(prev_common, value_columns)
+
+    # Column-level diff only for rows whose hash changed. The hash is only a pre-filter:
+    # a column present on one side only is reindexed as object NaN and hashes differently
+    # from <NA>, so UPDATE is decided by the column-level comparison.
+    cur_updated = cur_common[changed]
+    prev_updated = prev_common[changed]
+    same = np.column_stack([_column_equal(cur_updated[col], prev_updated[col]) for col in value_columns])
+    really_changed = ~same.all(axis=1)
+    cur_updated = cur_updated[really_changed]
+    same = same[really_changed]
+    names = np.array(value_columns, dtype=object)
+    changed_columns = [', '.join(names[~row]) for row in same]
+
+    parts = [
+        cur.loc[inserted].assign(**{CHANGE_TYPE_COLUMN: 'INSERT', CHANGED_COLUMNS_COLUMN: None}),
+        cur_updated.assign(**{CHANGE_TYPE_COLUMN: 'UPDATE', CHANGED_COLUMNS_COLUMN: changed_columns}),
+        pd.DataFrame(index=deleted).assign(**{CHANGE_TYPE_COLUMN: 'DELETE', CHANGED_COLUMNS_COLUMN: None}),
+    ]
+    parts = [part for part in parts if len(part)]
+    if not parts:
+        return pd.DataFrame(columns=[CHANGE_TYPE_COLUMN] + KEY_COLUMNS + [CHANGED_COLUMNS_COLUMN] + value_columns)
+
+    delta = pd.concat(parts).reset_index()
+    return delta.reindex(columns=[CHANGE_TYPE_COLUMN] + KEY_COLUMNS + [CHANGED_COLUMNS_COLUMN] + value_columns)
+
+def capture_changes(input_file, snapshot_file, changes_file):
+    """
+    Diff the current master table against the previous run's snapshot and save the delta.
+    The current master table is written to `<snapshot_file>.pending`; it only replaces the
+    snapshot once `promote_snapshot` is called after the delta has been applied, so a failed
+    or repeated transform never loses changes.
+    Args:
+        input_file (str): Path to the validated Excel file of this run.
+        snapshot_file (str): Path to the previous run's snapshot (CSV).
+        changes_file (str): Path to save the delta (CSV).
+    Returns:
+        pd.DataFrame: Delta rows.
+    """
+    current = read_company_excel(input_file)
+    if os.path.exists(snapshot_file):
+        previous = compact_company_frame(pd.read_csv(snapshot_file, dtype=str, encoding='utf-8-sig'))
+    else:
+        previous = current.iloc[0:0]
+
+    delta = compute_changes(previous, current)
+    expand_company_frame(delta).to_csv(changes_file, index=False, encoding='utf-8-sig')
+    expand_company_frame(current).to_csv(f"{snapshot_file}.pending", index=False, encoding='utf-8-sig')
+
+    counts = delta[CHANGE_TYPE_COLUMN].value_counts()
+    print(
+        f"Changes saved to {changes_file} "
+        f"(INSERT {counts.get('INSERT', 0)}, UPDATE {counts.get('UPDATE', 0)}, DELETE {counts.get('DELETE', 0)})"
+    )
+    return delta
+
+def promote_snapshot(snapshot_file):
+    """
+    Make the pending snapshot written by `capture_changes` the baseline for the next run.
+    Call only after the delta has been applied to the master table.
+    Args:
+        snapshot_file (str): Path to the snapshot (CSV).
+    """
+    pending_file = f"{snapshot_file}.pending"
+    if os.path.exists(pending_file):
+        os.replace(pending_file, snapshot_file)
+        print(f"Snapshot updated: {snapshot_file}")
+
+# Example usage:
+# capture_changes('data/validated_company_data.xlsx', 'data/master_snapshot.csv', 'data/company_changes.csv')
+# promote_snapshot('data/master_snapshot.csv')
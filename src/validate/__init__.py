@@ -1,9 +1,26 @@
 """
 validate 패키지: 데이터 유효성 검사(Validation) 관련 모듈을 포함합니다.
-예시: 사업자등록번호 등 외부 API 검증.
+예시: 사업자등록번호 등 외부 API 검증, 실패한 배치의 재시도 큐.
 """
-from .validator import validate_biz_numbers
+import importlib
+
+# 주요 함수는 처음 접근할 때 임포트 (pandas/requests 로딩 지연)
+_LAZY_ATTRS = {
+    "validate_biz_numbers": ".validator",
+    "replay_failed_batches": ".validator"
+}
 
 __all__ = [
-    "validate_biz_numbers"
-]
\ No newline at end of file
+    "validate_biz_numbers",
+    "replay_failed_batches"
+]
+
+def __getattr__(name):
+    if name in _LAZY_ATTRS:
+        value = getattr(importlib.import_module(_LAZY_ATTRS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -0,0 +1,57 @@
+"""
+Durable retry queue for NTS validation batches that could not be validated.
+Failed batches are spooled as JSON lines (one batch per line) together with
+the failure reason and the number of attempts made so far.
+"""
+
+import json
+import os
+from datetime import datetime
+
+def make_entry(batch, reason, attempts):
+    """
+    Build a spool entry for a failed batch.
+    Args:
+        batch (list): Business registration numbers in the batch.
+        reason (str): Why the batch failed.
+        attempts (int): Number of request attempts made so far.
+    Returns:
+        dict: Spool entry
+    """
+    return {
+        "b_no": list(batch),
+        "reason": reason,
+        "attempts": attempts,
+        "failed_at": datetime.now().isoformat(timespec="seconds"),
+    }
+
+def load_failed_batches(spool_path):
+    """
+    Load all failed batches from the spool.
+    Args:
+        spool_path (str): Path to the JSONL spool file.
+    Returns:
+        list: Spool entries (empty if the spool does not exist).
+    """
+    if not os.path.exists(spool_path):
+        return []
+    with open(spool_path, "r", encoding="utf-8") as spool:
+        return [json.loads(line) for line in spool if line.strip()]
+
+def save_failed_batches(spool_path, entries):
+    """
+    Replace the spool contents with the given entries.
+    The spool file is removed when there is nothing left to retry.
+    Args:
+        spool_path (str): Path to the JSONL spool file.
+        entries (list): Spool entries to keep.
+    """
+    if not entries:
+        if os.path.exists(spool_path):
+            os.remove(spool_path)
+        return
+    tmp_path = f"{spool_path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as spool:
+        for entry in entries:
+            spool.write(json.dumps(entry, ensure_ascii=False) + "\n")
+    os.replace(tmp_path, spool_path)
@@ -2,26 +2,92 @@
 Validate business registration numbers using the NTS API.
 """
 
-import pandas as pd
 import requests
 import json
 import time
 
-def validate_biz_numbers(input_path, output_path, service_key):
+from .retry_queue import make_entry, load_failed_batches, save_failed_batches
+
+from proprecessing.schema import FIXED_WIDTH_COLUMNS, format_fixed_width, read_company_excel, write_company_excel
+
+NTS_STATUS_URL = "https://api.odcloud.kr/api/nts-businessman/v1/status?serviceKey={service_key}"
+
+def request_batch(base_url, batch, max_retries=3):
+    """
+    Send one batch of business registration numbers to the NTS API.
+    Args:
+        base_url (str): NTS status API URL including the service key.
+        batch (list): Business registration numbers (max 100).
+        max_retries (int): Number of attempts before giving up.
+    Returns:
+        tuple: (result items or None, failure reason or None, attempts made)
+    """
+    payload = json.dumps({"b_no": batch})
+    headers = {"Content-Type": "application/json"}
+    reason = None
+
+    for attempt in range(1, max_retries + 1):
+        try:
+            response = requests.post(
+                base_url,
+                data=payload,
+                headers=headers,
+                timeout=10
+            )
+            response.raise_for_status()
+            result = response.json()
+
+            if "data" not in result:
+                print(f"[경고] 응답에 'data' 키 없음 ({batch[0]} 외 {len(batch) - 1}건)")
+                return None, "응답에 'data' 키 없음", attempt
+
+            time.sleep(0.5)  # 요청 간 딜레이
+            return result["data"], None, attempt
+
+        except requests.exceptions.Timeout:
+            reason = "요청 시간 초과"
+            print(f"[재시도 {attempt}/{max_retries}] 요청 시간 초과")
+            time.sleep(1)
+        except requests.exceptions.RequestException as e:
+            reason = f"API 오류: {e}"
+            print(f"[재시도 {attempt}/{max_retries}] API 오류: {e}")
+            time.sleep(1)
+
+    return None, reason, max_retries
+
+def apply_validation_results(df, items):
+    """
+    Write NTS results into the '사업자등록번호 유효성' column of the dataframe.
+    Args:
+        df (pd.DataFrame): Company data keyed by '사업자등록번호'.
+        items (list): 'data' items returned by the NTS API.
+    """
+    status = {
+        int(item["b_no"]): item.get("tax_type", "") != "국세청에 등록되지 않은 사업자등록번호입니다."
+        for item in items
+    }
+    matched = df["사업자등록번호"].isin(list(status))
+    is_valid = df.loc[matched, "사업자등록번호"].map(status).astype(bool)
+    df.loc[matched, "사업자등록번호 유효성"] = is_valid.astype("int8")
+    df.loc[is_valid.index[~is_valid], "업종코드"] = None
+
+def validate_biz_numbers(input_path, output_path, service_key, spool_path="failed_batches.jsonl"):
     """
     Validate business registration numbers and update the dataframe.
+    Batches that still fail after all retries are spooled to `spool_path`
+    so they can be re-validated later with `replay_failed_batches`.
     Args:
         input_path (str): Path to cleaned Excel file.
         output_path (str): Path to save validated Excel file.
         service_key (str): NTS API service key.
+        spool_path (str): Path to the failed batch spool (JSONL).
     """
-    base_url = f"https://api.odcloud.kr/api/nts-businessman/v1/status?serviceKey={service_key}"
+    base_url = NTS_STATUS_URL.format(service_key=service_key)
 
-    df = pd.read_excel(input_path, dtype={"전화번호": str, "팩스번호": str})
-    df = df[df["사업자등록번호"].notna()]
-    df["사업자등록번호"] = df["사업자등록번호"].astype(str).str.replace("-", "").str.zfill(10)
-    df = df[df["사업자등록번호"].str.isdigit()]
-    b_no_list = df["사업자등록번호"].tolist()
+    # 숫자가 아닌 사업자등록번호는 compact schema 변환 시 NA가 되어 제외됨
+    df = read_company_excel(input_path)
+    df = df[df["사업자등록번호"].notna()].copy()
+    b_no_list = format_fixed_width(df["사업자등록번호"], FIXED_WIDTH_COLUMNS["사업자등록번호"][0]).tolist()
 
     batch_size = 100
     max_retries = 3
@@ -29,56 +95,55 @@ def validate_biz_numbers(input_path, output_path, service_key):
 
     for i in range(0, len(b_no_list), batch_size):
         batch = b_no_list[i:i + batch_size]
-        payload = json.dumps({"b_no": batch})
-        headers = {"Content-Type": "application/json"}
-
-        for attempt in range(1, max_retries + 1):
-            try:
-                response = requests.post(
-                    base_url,
-                    data=payload,
-                    headers=headers,
-                    timeout=10
-                )
-                response.raise_for_status()
-                result = response.json()
-
-                if "data" not in result:
-                    print(f"[경고] 응답에 'data' 키 없음 (batch {i}-{i + batch_size})")
-                    failed_batches.append(batch)
-                    break
-
-                for item in result["data"]:
-                    b_no = item["b_no"]
-                    is_valid = item.get("tax_type", "") != "국세청에 등록되지 않은 사업자등록번호입니다."
-                    df.loc[df["사업자등록번호"] == b_no, "사업자등록번호 유효성"] = 1 if is_valid else 0
-                    if not is_valid:
-                        df.loc[df["사업자등록번호"] == b_no, "업종코드"] = None
-
-                time.sleep(0.5)  # 요청 간 딜레이
-                break  # 성공했으면 retry loop 탈출
-
-            except requests.exceptions.Timeout:
-                print(f"[재시도 {attempt}/{max_retries}] 요청 시간 초과 (batch {i}-{i + batch_size})")
-                time.sleep(1)
-            except requests.exceptions.RequestException as e:
-                print(f"[재시도 {attempt}/{max_retries}] API 오류: {e}")
-                time.sleep(1)
-        else:
-            # 재시도 모두 실패
-            print(f"[오류] 요청 실패: batch {i}-{i + batch_size} → 로그 저장")
-            failed_batches.append(batch)
-
-    # 실패한 배치 로그 저장
+        items, reason, attempts = request_batch(base_url, batch, max_retries)
+        if items is None:
+            print(f"[오류] 요청 실패: batch {i}-{i + batch_size} → 재시도 큐에 저장")
+            failed_batches.append(make_entry(batch, reason, attempts))
+            continue
+        apply_validation_results(df, items)
+
+    # 실패한 배치는 재시도 큐에 저장 (전체 재실행이므로 이전 큐는 대체)
+    save_failed_batches(spool_path, failed_batches)
     if failed_batches:
-        with open("failed_batches.log", "a", encoding="utf-8") as log_file:
-            for batch in failed_batches:
-                log_file.write(f"Failed batch: {batch}\n")
-        print(f"[완료] 실패한 요청 {len(failed_batches)}건 → failed_batches.log에 기록됨")
+        print(f"[완료] 실패한 요청 {len(failed_batches)}건 → {spool_path}에 기록됨")
 
     # 최종 저장
-    df.to_excel(output_path, index=False, engine="openpyxl")
+    write_company_excel(df, output_path)
     print(f"Validation results saved to {output_path}")
 
+def replay_failed_batches(validated_path, service_key, spool_path="failed_batches.jsonl"):
+    """
+    Re-validate only the spooled failed batches and patch the validated file in place.
+    Batches that fail again stay in the spool with an increased attempt count.
+    Args:
+        validated_path (str): Path to the validated Excel file to patch.
+        service_key (str): NTS API service key.
+        spool_path (str): Path to the failed batch spool (JSONL).
+    Returns:
+        int: Number of batches still left in the spool.
+    """
+    entries = load_failed_batches(spool_path)
+    if not entries:
+        print(f"No failed batches to replay in {spool_path}")
+        return 0
+
+    base_url = NTS_STATUS_URL.format(service_key=service_key)
+    df = read_company_excel(validated_path)
+
+    remaining = []
+    for entry in entries:
+        items, reason, attempts = request_batch(base_url, entry["b_no"])
+        if items is None:
+            retry = make_entry(entry["b_no"], reason, entry.get("attempts", 0) + attempts)
+            remaining.append(retry)
+            continue
+        apply_validation_results(df, items)
+
+    write_company_excel(df, validated_path)
+    save_failed_batches(spool_path, remaining)
+    print(f"Replayed {len(entries) - len(remaining)}/{len(entries)} failed batches into {validated_path}")
+    return len(remaining)
+
 # Example usage:
 # validate_biz_numbers('data/cleaned_company_info.xlsx', 'data/final_validated.xlsx', 'YOUR_SERVICE_KEY')
+# replay_failed_batches('data/final_validated.xlsx', 'YOUR_SERVICE_KEY')
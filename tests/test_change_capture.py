@@ -0,0 +1,99 @@
+import pandas as pd
+from transform.change_capture import compute_changes, capture_changes, promote_snapshot
+from transform.transformer import transform_with_metadata, transform_changes
+
+def make_master(rows):
+    return pd.DataFrame(rows, columns=['사업자등록번호', '고유번호', '정식명칭', '대표자명'])
+
+def test_compute_changes():
+    previous = make_master([
+        ['3128134722', '00434003', '다코', '김상규'],
+        ['1078155350', '00126380', '삼성전자', '한종희'],
+        ['2208162517', '00164779', '에스케이하이닉스', '곽노정'],
+    ])
+    current = make_master([
+        ['3128134722', '00434003', '다코', '김상규'],
+        ['1078155350', '00126380', '삼성전자', '전영현'],
+        ['1208147521', '00356361', '네이버', '최수연'],
+    ])
+    delta = compute_changes(previous, current).set_index('사업자등록번호')
+    assert len(delta) == 3
+    assert delta.loc['1208147521', '변경구분'] == 'INSERT'
+    assert delta.loc['1078155350', '변경구분'] == 'UPDATE'
+    assert delta.loc['1078155350', '변경컬럼'] == '대표자명'
+    assert delta.loc['1078155350', '대표자명'] == '전영현'
+    assert delta.loc['2208162517', '변경구분'] == 'DELETE'
+
+def test_transform_changes_patches_master(tmp_path):
+    snapshot_fp = tmp_path / "snapshot.csv"
+    changes_fp = tmp_path / "changes.csv"
+    master_fp = tmp_path / "master.xlsx"
+    delta_fp = tmp_path / "delta.xlsx"
+
+    first_fp = tmp_path / "first.xlsx"
+    make_master([
+        ['3128134722', '00434003', '다코', '김상규'],
+        ['1078155350', '00126380', '삼성전자', '한종희'],
+    ]).to_excel(first_fp, index=False)
+    capture_changes(first_fp, snapshot_fp, changes_fp)
+    transform_with_metadata(first_fp, master_fp)
+    promote_snapshot(snapshot_fp)
+
+    second_fp = tmp_path / "second.xlsx"
+    make_master([
+        ['3128134722', '00434003', '다코', '김상규'],
+        ['1208147521', '00356361', '네이버', '최수연'],
+    ]).to_excel(second_fp, index=False)
+    delta = capture_changes(second_fp, snapshot_fp, changes_fp)
+    assert sorted(delta['변경구분']) == ['DELETE', 'INSERT']
+    # 변환 전에 다시 실행해도 스냅샷이 그대로라 같은 변경분이 나와야 함
+    delta = capture_changes(second_fp, snapshot_fp, changes_fp)
+    assert sorted(delta['변경구분']) == ['DELETE', 'INSERT']
+
+    transform_changes(changes_fp, delta_fp, master_file=master_fp)
+    promote_snapshot(snapshot_fp)
+    assert capture_changes(second_fp, snapshot_fp, changes_fp).empty
+    out = pd.read_excel(master_fp, dtype=str)
+    names = out.loc[out['논리컬럼명'] == '정식명칭', '데이터'].tolist()
+    assert names == ['다코', '네이버']
+    assert len(pd.read_excel(delta_fp, dtype=str).dropna(how='all')) == 21
+
+
+def test_transform_changes_matches_unpadded_master(tmp_path):
+    # 고유번호 0 채움 이전에 만들어진 master ('434003')도 같은 기업으로 인식해야 함
+    input_fp = tmp_path / "input.xlsx"
+    master_fp = tmp_path / "master.xlsx"
+    changes_fp = tmp_path / "changes.csv"
+    delta_fp = tmp_path / "delta.xlsx"
+    pd.DataFrame({
+        '순번': [1, 2, 3, None],
+        '논리컬럼명': ['사업자등록번호', '고유번호', '정식명칭', None],
+        '물리컬럼명': ['BIZRGNO', 'UNIQNO', 'OFCLNM', None],
+        '데이터': ['3128134722', '434003', '다코(구)', None],
+    }).to_excel(master_fp, index=False)
+
+    make_master([['3128134722', '00434003', '다코', '김상규']]).to_excel(input_fp, index=False)
+    capture_changes(input_fp, tmp_path / "snapshot.csv", changes_fp)
+    transform_changes(changes_fp, delta_fp, master_file=master_fp)
+
+    out = pd.read_excel(master_fp, dtype=str)
+    assert out.loc[out['논리컬럼명'] == '정식명칭', '데이터'].tolist() == ['다코']
+
+def test_column_added_or_dropped_is_not_an_update():
+    from proprecessing.schema import compact_company_frame
+    previous = compact_company_frame(make_master([
+        ['3128134722', '00434003', '다코', '김상규'],
+        ['1078155350', '00126380', '삼성전자', '한종희'],
+    ]))
+    current = compact_company_frame(make_master([
+        ['3128134722', '00434003', '다코', '김상규'],
+        ['1078155350', '00126380', '삼성전자', '한종희'],
+    ]).assign(최대주주명=[None, '삼성생명보험']))
+
+    delta = compute_changes(previous, current).set_index('사업자등록번호')
+    assert delta.index.tolist() == [1078155350]
+    assert delta.loc[1078155350, '변경컬럼'] == '최대주주명'
+
+    # 반대로 컬럼이 빠진 경우도 값이 없던 기업은 변경 없음
+    delta = compute_changes(current, previous).set_index('사업자등록번호')
+    assert delta.index.tolist() == [1078155350]
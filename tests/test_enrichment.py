@@ -0,0 +1,97 @@
+import json
+import threading
+import pytest
+from collect import enrichment
+from collect.enrichment import DartClient, classify_sme, enrich_company
+
+FINANCIAL = {"status": "000", "list": [
+    {"fs_div": "CFS", "account_nm": "매출액", "thstrm_amount": "90,000,000,000"},
+    {"fs_div": "OFS", "account_nm": "매출액", "thstrm_amount": "30,000,000,000"},
+    {"fs_div": "OFS", "account_nm": "자산총계", "thstrm_amount": "50,000,000,000"},
+]}
+SHAREHOLDERS = {"status": "000", "list": [
+    {"nm": "김상규", "relate": "본인", "trmend_posesn_stock_qota_rt": "35.20"},
+    {"nm": "계", "relate": "-", "trmend_posesn_stock_qota_rt": "40.00"},
+]}
+
+class FakeClient(DartClient):
+    def __init__(self):
+        super().__init__("dummy", rate_per_sec=1000)
+        # 두 엔드포인트 요청이 동시에 진행 중이어야만 통과 (순차 실행이면 timeout)
+        self.barrier = threading.Barrier(2, timeout=5)
+        self.calls = []
+
+    def get(self, endpoint, **params):
+        self.calls.append(endpoint)
+        self.barrier.wait()
+        payload = FINANCIAL if endpoint == "fnlttSinglAcnt.json" else SHAREHOLDERS
+        return json.dumps(payload).encode()
+
+def test_enrichers_run_concurrently_and_merge():
+    client = FakeClient()
+    record = enrich_company(client, "00434003", bsns_year="2024")
+    assert sorted(client.calls) == ["fnlttSinglAcnt.json", "hyslrSttus.json"]
+    assert record["매출액"] == 30_000_000_000
+    assert record["자산총계"] == 50_000_000_000
+    assert record["중소기업여부"] is None
+    assert record["최대주주명"] == "김상규"
+    assert record["최대주주지분율"] == "35.20"
+
+def test_client_caches_responses(monkeypatch):
+    calls = []
+
+    class FakeResponse:
+        content = b'{"status": "013"}'
+
+        def raise_for_status(self):
+            pass
+
+    client = DartClient("dummy", rate_per_sec=1000)
+    monkeypatch.setattr(client.session, "get", lambda *a, **k: calls.append(a) or FakeResponse())
+    assert client.get_list("hyslrSttus.json", corp_code="00434003") == []
+    assert client.get_list("hyslrSttus.json", corp_code="00434003") == []
+    assert len(calls) == 1
+
+def test_client_does_not_cache_transient_errors(monkeypatch):
+    bodies = [b'{"status": "020", "message": "limit"}', b'{"status": "000", "list": [{"nm": "a"}]}']
+    calls = []
+
+    class FakeResponse:
+        def __init__(self, content):
+            self.content = content
+
+        def raise_for_status(self):
+            pass
+
+    client = DartClient("dummy", rate_per_sec=1000, cache_size=1)
+    monkeypatch.setattr(client.session, "get", lambda *a, **k: calls.append(a) or FakeResponse(bodies[min(len(calls) - 1, 1)]))
+    with pytest.raises(ValueError):
+        client.get_list("hyslrSttus.json", corp_code="1")
+    assert client.get_list("hyslrSttus.json", corp_code="1") == [{"nm": "a"}]
+    assert client.get_list("hyslrSttus.json", corp_code="1") == [{"nm": "a"}]
+    assert len(calls) == 2
+
+    client.get_list("hyslrSttus.json", corp_code="2")
+    assert len(client.cache) == 1
+
+def test_classify_sme():
+    assert classify_sme(30_000_000_000, 50_000_000_000) is None
+    assert classify_sme(30_000_000_000, 600_000_000_000) == 1
+    assert classify_sme(100_000_000_000, 50_000_000_000) is None
+    assert classify_sme(None, None) is None
+
+def test_annual_report_falls_back_to_previous_year(monkeypatch):
+    requested_years = []
+
+    class YearClient(DartClient):
+        def get(self, endpoint, **params):
+            requested_years.append(params["bsns_year"])
+            # 직전 연도 사업보고서는 아직 제출 전(013)
+            if params["bsns_year"] == enrichment.default_business_years()[0]:
+                return b'{"status": "013"}'
+            return json.dumps(SHAREHOLDERS).encode()
+
+    client = YearClient("dummy", rate_per_sec=1000)
+    record = enrich_company(client, "00434003", enrichers=["major_shareholder"])
+    assert requested_years == enrichment.default_business_years()
+    assert record["최대주주명"] == "김상규"
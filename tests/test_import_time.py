@@ -0,0 +1,55 @@
+import ast
+import os
+import subprocess
+import sys
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+SRC = os.path.join(ROOT, 'src')
+HEAVY_MODULES = {'pandas', 'numpy', 'requests', 'xmltodict', 'openpyxl'}
+PACKAGES = ['collect', 'proprecessing', 'validate', 'transform', 'export', 'query']
+# 패키지 import 전체(cumulative) 시간 예산, 마이크로초
+IMPORT_BUDGET_US = 50_000
+
+def run_importtime(statement, cwd, pythonpath):
+    env = dict(os.environ, PYTHONPATH=pythonpath)
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', statement],
+        cwd=cwd, env=env, capture_output=True, text=True, check=True
+    )
+    timings = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or '[us]' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        timings[name.strip()] = int(cumulative)
+    return timings
+
+def test_subpackages_import_lazily():
+    timings = run_importtime('import ' + ', '.join(PACKAGES), ROOT, SRC)
+    assert not HEAVY_MODULES & set(timings)
+    assert sum(timings[name] for name in PACKAGES) < IMPORT_BUDGET_US
+
+def test_src_package_imports_lazily():
+    timings = run_importtime('import src', ROOT, ROOT)
+    assert not HEAVY_MODULES & set(timings)
+    assert timings['src'] < IMPORT_BUDGET_US
+
+def test_lazy_attribute_resolves():
+    import validate
+    from validate.validator import validate_biz_numbers
+    assert validate.validate_biz_numbers is validate_biz_numbers
+
+def test_dag_has_no_top_level_src_imports():
+    with open(os.path.join(ROOT, 'airflow', 'dags', 'company_etl_dag.py'), encoding='utf-8') as f:
+        tree = ast.parse(f.read())
+    top_level = set()
+    for node in tree.body:
+        if isinstance(node, ast.Import):
+            top_level.update(alias.name.split('.')[0] for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            top_level.add(node.module.split('.')[0])
+    assert not (set(PACKAGES) | HEAVY_MODULES) & top_level
+
+def test_src_import_leaves_sys_path_untouched():
+    statement = 'import sys; before = list(sys.path); import src; assert sys.path == before'
+    subprocess.run([sys.executable, '-c', statement], cwd=ROOT, env=dict(os.environ, PYTHONPATH=ROOT), check=True)
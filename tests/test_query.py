@@ -0,0 +1,29 @@
+import pandas as pd
+from transform.transformer import transform_with_metadata
+from query.company_store import build_company_store, CompanyStore
+
+def test_company_store_lookups(tmp_path):
+    input_fp = tmp_path / "input.xlsx"
+    master_fp = tmp_path / "master.xlsx"
+    db_fp = tmp_path / "company.db"
+    pd.DataFrame({
+        "사업자등록번호": ["3128134722", "1048177488", "2208162517"],
+        "고유번호": ["434003", "00430964", "00164779"],
+        "정식명칭": ["다코", "굿앤엘에스", "에스케이하이닉스"],
+        "약식명칭": ["다코", "굿앤엘에스", "SK하이닉스"],
+        "종목코드": [None, None, "000660"],
+    }).to_excel(input_fp, index=False)
+    transform_with_metadata(input_fp, master_fp)
+    assert build_company_store(master_fp, db_fp) == 3
+
+    with CompanyStore(db_fp) as store:
+        assert store.find_by_biz_no("312-81-34722")[0]["OFCLNM"] == "다코"
+        assert store.find_by_corp_code("00434003")[0]["BIZRGNO"] == "3128134722"
+        assert store.find_by_stock_code("000660")[0]["OFCLNM"] == "에스케이하이닉스"
+        assert [c["OFCLNM"] for c in store.search_name_prefix("에스")] == ["에스케이하이닉스"]
+        assert [c["OFCLNM"] for c in store.search_name("sk 하이닉스")] == ["에스케이하이닉스"]
+        assert [c["OFCLNM"] for c in store.search_name("엘")] == ["굿앤엘에스"]
+        assert store.search_name("닉하") == []
+        found = store.find_many_by_biz_no(["3128134722", "0000000000"])
+        assert len(found["3128134722"]) == 1
+        assert found["0000000000"] == []
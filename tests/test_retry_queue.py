@@ -0,0 +1,55 @@
+import pandas as pd
+import requests
+from validate import validator
+from validate.retry_queue import make_entry, load_failed_batches, save_failed_batches
+
+class FakeResponse:
+    def __init__(self, payload):
+        self.payload = payload
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self.payload
+
+def test_failed_batch_is_spooled_and_replayed(tmp_path, monkeypatch):
+    monkeypatch.setattr(validator.time, "sleep", lambda s: None)
+    input_fp = tmp_path / "input.xlsx"
+    output_fp = tmp_path / "output.xlsx"
+    spool_fp = tmp_path / "failed_batches.jsonl"
+    pd.DataFrame({
+        "사업자등록번호": ["3128134722"],
+        "정식명칭": ["다코"],
+        "업종코드": ["25931"],
+        "사업자등록번호 유효성": [None]
+    }).to_excel(input_fp, index=False)
+
+    def post_timeout(*args, **kwargs):
+        raise requests.exceptions.Timeout()
+    monkeypatch.setattr(validator.requests, "post", post_timeout)
+    validator.validate_biz_numbers(input_fp, output_fp, "dummy", spool_path=str(spool_fp))
+
+    entries = load_failed_batches(spool_fp)
+    assert len(entries) == 1
+    assert entries[0]["b_no"] == ["3128134722"]
+    assert entries[0]["attempts"] == 3
+    assert entries[0]["reason"] == "요청 시간 초과"
+
+    def post_ok(*args, **kwargs):
+        return FakeResponse({"data": [{"b_no": "3128134722", "tax_type": "부가가치세 일반과세자"}]})
+    monkeypatch.setattr(validator.requests, "post", post_ok)
+    remaining = validator.replay_failed_batches(output_fp, "dummy", spool_path=str(spool_fp))
+
+    assert remaining == 0
+    assert not spool_fp.exists()
+    out = pd.read_excel(output_fp, dtype=str)
+    assert out["사업자등록번호 유효성"].iloc[0] == "1"
+
+def test_spool_round_trip(tmp_path):
+    spool_fp = tmp_path / "failed_batches.jsonl"
+    assert load_failed_batches(spool_fp) == []
+    save_failed_batches(spool_fp, [make_entry(["1234567890"], "API 오류", 2)])
+    entries = load_failed_batches(spool_fp)
+    assert entries[0]["b_no"] == ["1234567890"]
+    assert entries[0]["attempts"] == 2
@@ -0,0 +1,40 @@
+import pandas as pd
+from proprecessing.schema import compact_company_frame, expand_company_frame, bytes_per_row, memory_report
+
+def test_compact_schema_round_trip_and_memory():
+    n = 1000
+    df = pd.DataFrame({
+        '사업자등록번호': ['3128134722', '0108134722'] * (n // 2),
+        '고유번호': ['00434003', '434003'] * (n // 2),
+        '정식명칭': ['다코', '굿앤엘에스'] * (n // 2),
+        '업종코드': ['25931', '64999'] * (n // 2),
+        '설립일': ['19970611', None] * (n // 2),
+        '전화번호': ['0415651800', None] * (n // 2),
+        '사업자등록번호 유효성': ['1', None] * (n // 2),
+    }).astype(object)
+    before_bytes = bytes_per_row(df)
+    compact = compact_company_frame(df)
+    assert str(compact['사업자등록번호'].dtype) == 'UInt64'
+    assert str(compact['업종코드'].dtype) == 'category'
+    assert str(compact['사업자등록번호 유효성'].dtype) == 'category'
+
+    out = expand_company_frame(compact)
+    assert out['사업자등록번호'].iloc[1] == '0108134722'
+    assert out['고유번호'].iloc[1] == '00434003'
+    assert out['설립일'].iloc[1] is None
+    assert out['전화번호'].iloc[0] == '0415651800'
+    assert out['사업자등록번호 유효성'].iloc[0] == 1
+
+    assert memory_report(before_bytes, bytes_per_row(compact))['ratio'] >= 3
+
+
+def test_overlong_digits_become_na():
+    df = pd.DataFrame({
+        '고유번호': ['12345678901234567890123', '00434003'],
+        '사업자등록번호': ['31281347220', '3128134722'],
+        '매출액': ['1234567890123456789012', '100'],
+    })
+    compact = compact_company_frame(df)
+    assert compact['고유번호'].isna().tolist() == [True, False]
+    assert compact['사업자등록번호'].isna().tolist() == [True, False]
+    assert compact['매출액'].isna().tolist() == [True, False]